@@ -1,12 +1,18 @@
+import sys
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Optional
 
-@dataclass
+DEFAULT_RETURN_DAYS = 14
+_DEFAULT_LOAN_PERIOD = timedelta(days=DEFAULT_RETURN_DAYS)
+
+@dataclass(slots=True, eq=False)
 class Book:
     """
     Represents a book in the library system.
     Uses a class because books have state (availability, due date) that needs to be managed.
+    Uses slots because catalogs hold many books and need no per-instance __dict__.
+    Books are identified by ISBN, so equality and hashing use the ISBN only.
     """
     isbn: str
     title: str
@@ -14,17 +20,36 @@ class Book:
     is_available: bool = True
     due_date: Optional[datetime] = None
 
-    def check_out(self, return_days: int = 14) -> datetime:
+    def __post_init__(self) -> None:
+        """
+        Interns author and ISBN strings.
+        Many books share an author, so they share one string object.
+        """
+        self.author = sys.intern(self.author)
+        self.isbn = sys.intern(self.isbn)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Book):
+            return NotImplemented
+        return self.isbn == other.isbn
+
+    def __hash__(self) -> int:
+        return hash(self.isbn)
+
+    def check_out(self, return_days: int = DEFAULT_RETURN_DAYS) -> datetime:
         """
         Changes book state to checked out and calculates due date.
         Uses a method because it modifies object state.
         """
         if not self.is_available:
             raise ValueError("Book is already checked out")
-        
-        from datetime import timedelta
+
+        if return_days == DEFAULT_RETURN_DAYS:
+            loan_period = _DEFAULT_LOAN_PERIOD
+        else:
+            loan_period = timedelta(days=return_days)
         self.is_available = False
-        self.due_date = datetime.now() + timedelta(days=return_days)
+        self.due_date = datetime.now() + loan_period
         return self.due_date
 
     def return_book(self) -> None:
@@ -0,0 +1,77 @@
+from array import array
+from datetime import date, datetime, timedelta
+from typing import List, Optional
+
+from src.models.book import Book
+
+# Due dates are stored as whole days since this epoch in 32-bit ints
+_EPOCH = date(2000, 1, 1)
+# Sentinel for books that are not checked out; never earlier than today
+_NOT_DUE = 2**31 - 1
+
+def _to_day(day: date) -> int:
+    # datetime subclasses date but cannot be subtracted from one
+    if isinstance(day, datetime):
+        day = day.date()
+    return (day - _EPOCH).days
+
+class BookCatalog:
+    """
+    Stores many books column by column for bulk queries.
+    Uses parallel columns instead of a list of Book objects to save memory:
+    availability and due days are packed C arrays rather than boxed objects.
+    Scans are not faster, since iterating an array boxes each element.
+    """
+
+    def __init__(self) -> None:
+        self.isbns: List[str] = []
+        self.titles: List[str] = []
+        self.authors: List[str] = []
+        self.is_available = array("b")
+        # Days since _EPOCH; _NOT_DUE marks a book that is not checked out
+        self.due_day = array("i")
+
+    def __len__(self) -> int:
+        return len(self.isbns)
+
+    def add(self, book: Book) -> int:
+        """
+        Appends a book to the catalog and returns its index.
+        """
+        self.isbns.append(book.isbn)
+        self.titles.append(book.title)
+        self.authors.append(book.author)
+        self.is_available.append(book.is_available)
+        self.due_day.append(
+            _NOT_DUE if book.due_date is None else _to_day(book.due_date)
+        )
+        return len(self.isbns) - 1
+
+    def mark_returned(self, index: int) -> None:
+        """
+        Marks the book at index as available again.
+        """
+        self.is_available[index] = True
+        self.due_day[index] = _NOT_DUE
+
+    def due_date(self, index: int) -> Optional[date]:
+        """
+        Returns the due date of the book at index, or None if it is available.
+        """
+        due = self.due_day[index]
+        return None if due == _NOT_DUE else _EPOCH + timedelta(days=due)
+
+    def overdue_indices(self, today: Optional[date] = None) -> List[int]:
+        """
+        Returns the indices of all books due before today.
+        """
+        today_day = _to_day(today or date.today())
+        return [index for index, due in enumerate(self.due_day) if due < today_day]
+
+    def days_overdue(self, today: Optional[date] = None) -> List[int]:
+        """
+        Returns days overdue for each overdue book, in index order.
+        Feeds directly into calculate_late_fee_batch for billing reports.
+        """
+        today_day = _to_day(today or date.today())
+        return [today_day - due for due in self.due_day if due < today_day]
@@ -5,35 +5,114 @@ Functions are used because these operations:
 2. Always return the same output for the same input
 3. Have no side effects
 """
+import re
+from functools import lru_cache
+from typing import Iterable, List, Tuple
 
+# Translation table that deletes hyphens and spaces in a single pass
+_ISBN_STRIP = str.maketrans("", "", "- ")
+
+BASE_FEE = 0.50  # 50 cents per day
+MAX_FEE = 20.00
+# Days overdue at which the fee reaches MAX_FEE
+_MAX_FEE_DAYS = MAX_FEE / BASE_FEE
+
+# Check-digit weights, most significant digit first
+_ISBN10_WEIGHTS = range(10, 0, -1)
+_ISBN13_WEIGHTS = (1, 3) * 6 + (1,)
+
+# ISBN-shaped candidates in free text; check digits are verified separately
+_ISBN_START = re.compile(r"(?<![0-9])[0-9]")
+_ISBN13_CANDIDATE = re.compile(r"(?:[0-9][- ]?){12}[0-9](?![0-9Xx])")
+_ISBN10_CANDIDATE = re.compile(r"(?:[0-9][- ]?){9}[0-9Xx](?![0-9Xx])")
+
+@lru_cache(maxsize=4096)
 def is_valid_isbn(isbn: str) -> bool:
     """
-    Validates ISBN format (simplified for example).
-    Pure function: same input always yields same output.
+    Validates an ISBN-10 or ISBN-13, including its check digit.
+    Pure function: same input always yields same output,
+    so results are memoized for repeated lookups.
     """
     # Remove hyphens and spaces
-    isbn = isbn.replace("-", "").replace(" ", "")
-    
-    if len(isbn) not in (10, 13):
-        return False
-        
-    # Check if all characters are digits (simplified validation)
-    return isbn.isdigit()
+    isbn = isbn.translate(_ISBN_STRIP)
+
+    if len(isbn) == 10:
+        body, check = isbn[:9], isbn[9]
+        if not (body.isascii() and body.isdigit()):
+            return False
+        if check in "Xx":
+            check_value = 10
+        elif check.isascii() and check.isdigit():
+            check_value = int(check)
+        else:
+            return False
+        digits = [int(c) for c in body] + [check_value]
+        return sum(w * d for w, d in zip(_ISBN10_WEIGHTS, digits)) % 11 == 0
+
+    if len(isbn) == 13:
+        if not (isbn.isascii() and isbn.isdigit()):
+            return False
+        return sum(w * int(c) for w, c in zip(_ISBN13_WEIGHTS, isbn)) % 10 == 0
+
+    return False
+
+def is_valid_isbn_batch(isbns: Iterable[str]) -> List[bool]:
+    """
+    Validates a whole column of ISBNs, e.g. during a bulk import.
+    Maps the cached scalar validator so duplicate ISBNs are checked once.
+    """
+    return list(map(is_valid_isbn, isbns))
+
+def find_isbns(text: str) -> List[Tuple[int, int]]:
+    """
+    Finds valid ISBNs in free text, e.g. a MARC record dump.
+    Returns the (start, end) span of each match. At each digit run the
+    ISBN-13 form is tried first, then the ISBN-10 form, so a failed 13-digit
+    candidate does not hide an ISBN-10 that starts at the same place.
+    """
+    spans = []
+    pos = 0
+    while (start := _ISBN_START.search(text, pos)) is not None:
+        index = start.start()
+        pos = index + 1
+        for candidate in (_ISBN13_CANDIDATE, _ISBN10_CANDIDATE):
+            match = candidate.match(text, index)
+            if match is not None and is_valid_isbn(match.group()):
+                spans.append(match.span())
+                pos = match.end()
+                break
+    return spans
 
 def is_valid_title(title: str) -> bool:
     """
     Validates book title.
     Pure function with no side effects.
     """
-    return bool(title.strip()) and len(title) <= 200
+    # isspace() stops at the first non-space character without copying the title
+    return 0 < len(title) <= 200 and not title.isspace()
+
+def validate_book_fields(isbn: str, title: str) -> Tuple[bool, bool]:
+    """
+    Validates the ISBN and title of an incoming book in one call.
+    Returns (isbn_ok, title_ok) so ingest code can report both problems.
+    """
+    return is_valid_isbn(isbn), is_valid_title(title)
 
 def calculate_late_fee(days_overdue: int) -> float:
     """
     Calculates late fee based on days overdue.
     Pure function: mathematical calculation with no side effects.
     """
-    BASE_FEE = 0.50  # 50 cents per day
-    MAX_FEE = 20.00
-    
     fee = days_overdue * BASE_FEE
-    return min(fee, MAX_FEE) 
\ No newline at end of file
+    return min(fee, MAX_FEE)
+
+def calculate_late_fee_batch(days_overdue: Iterable[int]) -> List[float]:
+    """
+    Calculates late fees for many loans at once, e.g. a nightly billing sweep.
+    Same rule as calculate_late_fee, without a Python call per loan:
+    the cap is an inline comparison on the day count instead of min().
+    """
+    return [
+        days * BASE_FEE if days < _MAX_FEE_DAYS else MAX_FEE
+        for days in days_overdue
+    ]
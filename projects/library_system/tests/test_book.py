@@ -48,4 +48,21 @@ def test_cannot_checkout_unavailable_book(sample_book):
     
     # Act/Assert
     with pytest.raises(ValueError, match="Book is already checked out"):
-        sample_book.check_out() 
\ No newline at end of file
+        sample_book.check_out() 
+
+def test_book_has_no_instance_dict(sample_book):
+    """Books use slots, so unknown attributes cannot be added."""
+    with pytest.raises(AttributeError):
+        sample_book.publisher = "Test Publisher"
+
+def test_books_share_interned_author(sample_book):
+    """Books by the same author share one author string object."""
+    other = Book(isbn="0306406152", title="Other Book", author="".join(["Test ", "Author"]))
+    assert other.author is sample_book.author
+
+def test_books_with_same_isbn_are_equal(sample_book):
+    """Books are identified by ISBN, regardless of their loan state."""
+    copy = Book(isbn="1234567890", title="Test Book", author="Test Author")
+    copy.check_out()
+    assert copy == sample_book
+    assert len({sample_book, copy}) == 1
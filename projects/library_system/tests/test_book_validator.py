@@ -1,14 +1,23 @@
 import pytest
-from src.services.book_validator import is_valid_isbn, is_valid_title, calculate_late_fee
+from src.services.book_validator import (
+    find_isbns, is_valid_isbn, is_valid_isbn_batch, is_valid_title,
+    validate_book_fields, calculate_late_fee, calculate_late_fee_batch,
+)
 
 @pytest.mark.parametrize("isbn,expected", [
-    ("1234567890", True),      # 10 digits
-    ("1234567890123", True),   # 13 digits
-    ("123456789", False),      # Too short
-    ("12345678901234", False), # Too long
-    ("123-456-789-0", True),   # With hyphens
-    ("123 456 7890", True),    # With spaces
-    ("123abc4567", False),     # With letters
+    ("0306406152", True),      # ISBN-10
+    ("080442957X", True),      # ISBN-10 with X check digit
+    ("9780306406157", True),   # ISBN-13
+    ("0306406153", False),     # ISBN-10, wrong check digit
+    ("9780306406158", False),  # ISBN-13, wrong check digit
+    ("1234567890", False),     # 10 digits, bad checksum
+    ("030640615", False),      # Too short
+    ("97803064061570", False), # Too long
+    ("0-306-40615-2", True),   # With hyphens
+    ("0 306 40615 2", True),   # With spaces
+    ("030abc6152", False),     # With letters
+    ("97803064061X7", False),  # X only allowed as ISBN-10 check digit
+    ("", False),               # Empty
 ])
 def test_isbn_validation(isbn: str, expected: bool):
     """
@@ -17,10 +26,30 @@ def test_isbn_validation(isbn: str, expected: bool):
     """
     assert is_valid_isbn(isbn) == expected
 
+def test_isbn_batch_validation():
+    """Batch validation matches the scalar validator element by element."""
+    isbns = ["0306406152", "0-306-40615-2", "030640615", "030abc6152"]
+    assert is_valid_isbn_batch(isbns) == [True, True, False, False]
+
+@pytest.mark.parametrize("text,expected", [
+    (
+        "0-306-40615-2; 9780306406157, bad 0306406153, long 103064061520",
+        ["0-306-40615-2", "9780306406157"],
+    ),
+    ("ISBN 0306406152 352 pages", ["0306406152"]),  # ISBN-10 then digits
+    ("0-306-40615-2 978", ["0-306-40615-2"]),       # ISBN-10 then digits
+    ("978 0306406152", ["0306406152"]),             # Digits then ISBN-10
+])
+def test_find_isbns_in_text(text: str, expected: list):
+    """Only ISBN-shaped runs with a valid check digit are reported."""
+    assert [text[start:end] for start, end in find_isbns(text)] == expected
+
 @pytest.mark.parametrize("title,expected", [
     ("Valid Title", True),
     ("", False),
     (" ", False),
+    (" \t\n", False),
+    ("  Padded Title  ", True),
     ("A" * 200, True),
     ("A" * 201, False),
 ])
@@ -28,6 +57,15 @@ def test_title_validation(title: str, expected: bool):
     """Parametrized test for title validation."""
     assert is_valid_title(title) == expected
 
+@pytest.mark.parametrize("isbn,title,expected", [
+    ("0306406152", "Valid Title", (True, True)),
+    ("0306406153", "Valid Title", (False, True)),
+    ("0306406152", " ", (True, False)),
+])
+def test_validate_book_fields(isbn: str, title: str, expected: tuple):
+    """Combined validation reports each field separately."""
+    assert validate_book_fields(isbn, title) == expected
+
 @pytest.mark.parametrize("days,expected_fee", [
     (0, 0.00),
     (1, 0.50),
@@ -36,4 +74,16 @@ def test_title_validation(title: str, expected: bool):
 ])
 def test_late_fee_calculation(days: int, expected_fee: float):
     """Parametrized test for late fee calculation."""
-    assert calculate_late_fee(days) == expected_fee 
\ No newline at end of file
+    assert calculate_late_fee(days) == expected_fee
+
+def test_late_fee_batch_calculation():
+    """Batch fee calculation matches the scalar rule for every loan."""
+    days = [0, 1, 10, 39, 40, 41, 100]
+    assert calculate_late_fee_batch(days) == [calculate_late_fee(d) for d in days]
+
+def test_isbn_validation_is_cached():
+    """Repeated calls with the same ISBN are served from the cache."""
+    is_valid_isbn.cache_clear()
+    is_valid_isbn("1234567890")
+    is_valid_isbn("1234567890")
+    assert is_valid_isbn.cache_info().hits == 1
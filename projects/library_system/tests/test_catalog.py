@@ -0,0 +1,55 @@
+import pytest
+from datetime import date, datetime, timedelta
+from src.models.book import Book
+from src.models.catalog import BookCatalog
+
+@pytest.fixture
+def catalog():
+    """Fixture providing a catalog with one available and two checked out books."""
+    catalog = BookCatalog()
+    catalog.add(Book(isbn="0306406152", title="On Shelf", author="Author A"))
+    for isbn, days_ago in (("9780306406157", 3), ("080442957X", -5)):
+        book = Book(isbn=isbn, title="On Loan", author="Author B")
+        book.check_out()
+        book.due_date = datetime.now() - timedelta(days=days_ago)
+        catalog.add(book)
+    return catalog
+
+def test_add_returns_index(catalog):
+    """Books are appended in order and indexed from zero."""
+    index = catalog.add(Book(isbn="1234567890", title="New", author="Author C"))
+    assert index == 3
+    assert len(catalog) == 4
+    assert catalog.isbns[index] == "1234567890"
+
+def test_overdue_indices(catalog):
+    """Only checked out books past their due date are overdue."""
+    assert catalog.overdue_indices() == [1]
+
+def test_days_overdue(catalog):
+    """Days overdue are reported in whole days."""
+    assert catalog.days_overdue() == [3]
+
+def test_book_due_today_is_not_overdue(catalog):
+    """Overdue counts whole days, so a book due today is not yet overdue."""
+    tomorrow = date.today() + timedelta(days=1)
+    assert catalog.overdue_indices(today=date.today() - timedelta(days=3)) == []
+    assert catalog.days_overdue(today=tomorrow) == [4]
+
+def test_queries_accept_datetime(catalog):
+    """A datetime such as Book.due_date can be passed as today."""
+    now = datetime.now()
+    assert catalog.overdue_indices(today=now) == [1]
+    assert catalog.days_overdue(today=now) == [3]
+
+def test_due_date(catalog):
+    """Due dates are converted back to dates at the API boundary."""
+    assert catalog.due_date(0) is None
+    assert catalog.due_date(1) == date.today() - timedelta(days=3)
+
+def test_mark_returned(catalog):
+    """Returned books are available and no longer overdue."""
+    catalog.mark_returned(1)
+    assert catalog.is_available[1]
+    assert catalog.due_date(1) is None
+    assert catalog.overdue_indices() == []